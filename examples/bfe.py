@@ -32,18 +32,27 @@ import math
 import os
 import pyrelic
 import struct
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pyrelic import (
     rand_BN_order,
     pair,
     generator_G1,
+    generator_G2,
     hash_to_G2,
     BN,
     G1,
     G2,
     GT,
+    PrecomputedG1,
 )
-from typing import Sequence, Optional, Tuple, List
+from typing import Sequence, Optional, Tuple
+
+# number of identities handled by a single worker task in keygen
+_KEYGEN_CHUNK_SIZE = 2**14
+# length of a serialized derived key
+_KEY_LENGTH = len(bytes(generator_G2()))
 
 
 class BloomFilter:
@@ -54,26 +63,26 @@ class BloomFilter:
         positive probability."""
 
         # size of bit array: m = -(n * log(p)) / log(2) ** 2
-        self.bitset_size = -math.floor(
+        bitset_size = -math.floor(
             filter_size * math.log(false_positive_probability) / (math.log(2) ** 2)
         )
         # hash count: k = m / n * ln(2)
-        self.hash_count = math.ceil(self.bitset_size / filter_size * math.log(2))
-
-    def _hash_to_position(self, hash_idx: int, data: bytes) -> int:
-        hash_context = hashlib.shake_256()
-        hash_context.update(b"BFE_HASH")
-        hash_context.update(struct.pack("<Q", hash_idx))
-        hash_context.update(data)
-        pos = struct.unpack("<Q", hash_context.digest(8))[0]
-        return pos % self.bitset_size
+        self.hash_count = math.ceil(bitset_size / filter_size * math.log(2))
+        # round m up to a power of two so that positions can be reduced with a mask;
+        # a larger bit array only lowers the false positive probability
+        self.bitset_size = 1 << (bitset_size - 1).bit_length()
+        self.mask = self.bitset_size - 1
 
     def get_bit_positions(self, data: bytes) -> Tuple[int, ...]:
         """Return all indices for the element."""
 
+        # derive all positions from a single SHAKE-256 output stream
+        hash_context = hashlib.shake_256()
+        hash_context.update(b"BFE_HASH")
+        hash_context.update(data)
+        buffer = hash_context.digest(8 * self.hash_count)
         return tuple(
-            self._hash_to_position(hash_idx, data)
-            for hash_idx in range(self.hash_count)
+            pos & self.mask for pos in struct.unpack(f"<{self.hash_count}Q", buffer)
         )
 
 
@@ -82,9 +91,15 @@ class PrivateKey:
     """BFE private key"""
 
     bloom_filter: BloomFilter
-    secret_keys: List[Optional[G2]]
+    # serialized derived keys of all identities, _KEY_LENGTH bytes each
+    secret_keys: bytearray
     key_size: int
     pk: G1
+    # bit map of the identities whose keys have not been removed yet
+    available: bytearray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.available = bytearray(b"\xff") * ((self.bloom_filter.bitset_size + 7) // 8)
 
     def __contains__(self, identity: int) -> bool:
         """Return True if key for the given identity is available."""
@@ -92,26 +107,35 @@ class PrivateKey:
         return (
             identity >= 0
             and identity < self.bloom_filter.bitset_size
-            and self.secret_keys[identity] is not None
+            and (self.available[identity >> 3] >> (identity & 7)) & 1 == 1
         )
 
+    def first_available(self, identities: Sequence[int]) -> Optional[int]:
+        """Return the index of the first identity (as obtained from the Bloom filter)
+        whose key is available."""
+
+        available = self.available
+        for idx, identity in enumerate(identities):
+            if (available[identity >> 3] >> (identity & 7)) & 1:
+                return idx
+        return None
+
     def __getitem__(self, identity: int) -> G2:
         """Return key associated to an identity."""
 
-        key = self.secret_keys[identity]
-        if key is None:
+        if identity not in self:
             raise IndexError
 
-        return key
+        offset = identity * _KEY_LENGTH
+        return G2(bytes(self.secret_keys[offset : offset + _KEY_LENGTH]))
 
     def __delitem__(self, identity: int) -> None:
         """Remove key associated to an identity."""
 
-        key = self.secret_keys[identity]
-        if key is not None:
-            key.set_neutral()
-            self.secret_keys[identity] = None
-            del key
+        if identity in self:
+            self.available[identity >> 3] &= ~(1 << (identity & 7))
+            offset = identity * _KEY_LENGTH
+            self.secret_keys[offset : offset + _KEY_LENGTH] = bytes(_KEY_LENGTH)
 
 
 @dataclass
@@ -131,8 +155,15 @@ class Ciphertext:
     v: Sequence[bytes]
 
 
+@lru_cache(maxsize=16)
+def _pk_table(pk: bytes) -> PrecomputedG1:
+    # pk is raised to a fresh r in every encaps/decaps; the table is kept out of the
+    # keys so that they remain picklable
+    return PrecomputedG1(G1(pk))
+
+
 def map_identity(identity: int) -> G2:
-    return hash_to_G2(struct.pack("<Q", identity))
+    return hash_to_G2(identity.to_bytes(8, "little"))
 
 
 def hash_r(key: bytes, key_size: int) -> Tuple[BN, bytes]:
@@ -154,31 +185,59 @@ def hash_and_xor(y: GT, message: bytes) -> bytes:
     hash_context = hashlib.shake_256()
     hash_context.update(b"BFE_BF_G")
     hash_context.update(bytes(y))
-    hash_context.update(struct.pack("<Q", message_len))
+    hash_context.update(message_len.to_bytes(8, "little"))
 
-    return bytes(d ^ m for d, m in zip(hash_context.digest(message_len), message))
+    key_stream = int.from_bytes(hash_context.digest(message_len), "little")
+    return (key_stream ^ int.from_bytes(message, "little")).to_bytes(
+        message_len, "little"
+    )
+
+
+def _extract_keys(exponent: bytes, start: int, stop: int) -> bytes:
+    """Extract the serialized derived keys for all identities in [start, stop)."""
+
+    exponent_bn = BN(exponent)
+    keys = b"".join(
+        bytes(map_identity(identity) ** exponent_bn) for identity in range(start, stop)
+    )
+    assert len(keys) == (stop - start) * _KEY_LENGTH
+    return keys
 
 
 def keygen(
-    key_size: int, filter_size: int, false_positive_probability: float
+    key_size: int,
+    filter_size: int,
+    false_positive_probability: float,
+    max_workers: Optional[int] = None,
 ) -> Tuple[PrivateKey, PublicKey]:
-    """Generate a new key pair."""
+    """Generate a new key pair.
+
+    The extraction of the derived keys is distributed over max_workers processes. Small
+    Bloom filters and max_workers=1 extract the keys in the calling process.
+    """
 
     exponent = rand_BN_order()  # BF secret key
     pk = generator_G1(exponent)  # BF public key
     bloom_filter = BloomFilter(filter_size, false_positive_probability)
 
+    # extract derived keys for all identities
+    starts = range(0, bloom_filter.bitset_size, _KEYGEN_CHUNK_SIZE)
+    stops = (
+        min(start + _KEYGEN_CHUNK_SIZE, bloom_filter.bitset_size) for start in starts
+    )
+    if len(starts) == 1 or max_workers == 1:
+        # not worth spawning worker processes
+        secret_keys = bytearray(
+            _extract_keys(bytes(exponent), 0, bloom_filter.bitset_size)
+        )
+    else:
+        with ProcessPoolExecutor(max_workers) as executor:
+            secret_keys = bytearray().join(
+                executor.map(partial(_extract_keys, bytes(exponent)), starts, stops)
+            )
+
     return (
-        PrivateKey(
-            bloom_filter,
-            # extract derived keys for all identities
-            [
-                map_identity(identity) ** exponent
-                for identity in range(bloom_filter.bitset_size)
-            ],
-            key_size,
-            pk,
-        ),
+        PrivateKey(bloom_filter, secret_keys, key_size, pk),
         PublicKey(bloom_filter, key_size, pk),
     )
 
@@ -197,14 +256,14 @@ def encaps(pk: PublicKey) -> Tuple[bytes, Ciphertext]:
 
     u = generator_G1(r)
     # instead of applying r to each pairing, precompute pk ** r
-    pkr = pk.pk**r
+    pkr = _pk_table(bytes(pk.pk)) ** r
 
     return k, Ciphertext(
         u,
-        tuple(
+        [
             internal_encrypt(pkr, identity, key)
             for identity in pk.bloom_filter.get_bit_positions(bytes(u))
-        ),
+        ],
     )
 
 
@@ -224,27 +283,29 @@ def decaps(sk: PrivateKey, ctxt: Ciphertext) -> Optional[bytes]:
         return hash_and_xor(pair(ctxt.u, sk), v)
 
     # obtain encrypted key from one of the ciphertexts
-    key: Optional[bytes] = None
     bit_positions = sk.bloom_filter.get_bit_positions(bytes(ctxt.u))
-    for v, identity in zip(ctxt.v, bit_positions):
-        # check if sk has a key for identitiy
-        if identity in sk:
-            key = internal_decrypt(sk[identity], v)
-            break
-    else:
+    used_idx = sk.first_available(bit_positions)
+    if used_idx is None:
         # no working derived keys available
         return None
+    key = internal_decrypt(sk[bit_positions[used_idx]], ctxt.v[used_idx])
 
     # derive r and k
     r, k = hash_r(key, sk.key_size)
-    pkr = sk.pk**r
 
-    # recompute ciphertext and verify equality
-    recomputed_u = generator_G1(r)
-    recomputed_v = tuple(
-        internal_encrypt(pkr, identity, key) for identity in bit_positions
-    )
-    return k if recomputed_u == ctxt.u and recomputed_v == ctxt.v else None
+    # recompute ciphertext and verify equality; check u first since it is cheap
+    if generator_G1(r) != ctxt.u:
+        return None
+
+    # With u = g_1^r, e(u, sk[identity]) = e(pk^r, H(identity)), so the component used
+    # for decryption re-encrypts to itself and its pairing can be skipped.
+    pkr = _pk_table(bytes(sk.pk)) ** r
+    if any(
+        idx != used_idx and internal_encrypt(pkr, identity, key) != v
+        for idx, (v, identity) in enumerate(zip(ctxt.v, bit_positions))
+    ):
+        return None
+    return k
 
 
 def test_bfe() -> None:
@@ -27,7 +27,6 @@ This example requires Python >= 3.7.
 """
 
 import hashlib
-import struct
 from dataclasses import dataclass
 from pyrelic import (
     BN,
@@ -88,10 +87,13 @@ def hash_and_xor(y: GT, message: bytes) -> bytes:
     hash_context.update(b"H_2")
     hash_context.update(bytes(y))
     # Also hash the message length
-    hash_context.update(struct.pack("<Q", message_len))
+    hash_context.update(message_len.to_bytes(8, "little"))
 
-    # XOR message with the digest
-    return bytes(d ^ m for d, m in zip(hash_context.digest(message_len), message))
+    # XOR message with the digest (as integers to avoid a per-byte loop)
+    key_stream = int.from_bytes(hash_context.digest(message_len), "little")
+    return (key_stream ^ int.from_bytes(message, "little")).to_bytes(
+        message_len, "little"
+    )
 
 
 def keygen() -> Tuple[MasterSecretKey, PublicKey]:
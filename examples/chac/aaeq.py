@@ -20,9 +20,9 @@
 
 import hashlib
 import secrets
-from functools import partial
-from dataclasses import dataclass
-from typing import Iterable, Optional, Sequence, Tuple, List
+from functools import lru_cache, partial
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Sequence, Tuple, List
 
 from pyrelic import (
     BN,
@@ -40,6 +40,8 @@ from pyrelic import (
 from . import tbeq
 from .tbeq import Signature, MessageVector
 
+_G2 = generator_G2()
+
 
 @dataclass
 class Attribute:
@@ -55,6 +57,17 @@ class PublicKey:
 
     x: tbeq.PublicKey
     attrName: str
+    # key-dependent prefix of the input to _H
+    hash_prefix: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.hash_prefix = b"||".join(
+            (
+                b"|".join(bytes(pki) for pki in self.x.x),
+                self.attrName.encode("utf8"),
+                b"",
+            )
+        )
 
 
 @dataclass
@@ -72,6 +85,10 @@ class MainPublicKey:
     """AAEQ main public key."""
 
     x: Tuple[PublicKey, ...]
+    by_name: Dict[str, PublicKey] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.by_name = {pk.attrName: pk for pk in self.x}
 
 
 @dataclass
@@ -79,6 +96,10 @@ class MainPrivateKey:
     """AAEQ main private key"""
 
     x: Tuple[PrivateKey, ...]
+    by_name: Dict[str, PrivateKey] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.by_name = {sk.attrName: sk for sk in self.x}
 
 
 def setup(
@@ -103,15 +124,19 @@ def setup(
 
 
 def gen(msk: MainPrivateKey, attribute_name: str) -> PrivateKey:
-    """Access attribute-specific private key."""
+    """Access attribute-specific private key.
+
+    Raises KeyError if there is no key for the attribute."""
 
     return _findsk(msk, attribute_name)
 
 
 def _H(value: bytes, pk: PublicKey) -> G2:
-    data = b"||".join(
-        (b"|".join(bytes(pki) for pki in pk.x.x), pk.attrName.encode("utf8"), value)
-    )
+    return _hash_to_G2(pk.hash_prefix + value)
+
+
+@lru_cache(maxsize=1024)
+def _hash_to_G2(data: bytes) -> G2:
     return hash_to_G2(data)
 
 
@@ -135,34 +160,32 @@ def verify(
     attributes: Sequence[Attribute],
     aggr_sigma: Signature,
 ) -> bool:
-    """Verify the signature on a message vector."""
+    """Verify the signature on a message vector.
+
+    Raises KeyError if one of the attributes has no public key."""
 
     pks = _pks_for_attr(mpk, attributes)
-    if any(pk is None for pk in pks):
+    if any(len(pk.x.x) != len(message.m) for pk in pks):
         return False
 
-    return (
-        pair_product(
-            (aggr_sigma.z1.invert(), aggr_sigma.y2),
-            *tuple(
-                (msg, product_G2(pk.x.x[index] for pk in pks))
-                for index, msg in enumerate(message.m)
-            ),
-        ).is_neutral()
-        and pair_product(
-            (aggr_sigma.y1.invert(), generator_G2()), (generator_G1(), aggr_sigma.y2)
-        ).is_neutral()
-        and pair_product(
-            (generator_G1(), aggr_sigma.v2),
-            (
-                aggr_sigma.y1.invert(),
-                product_G2(
-                    _H(attr.value.encode("utf8"), pk)
-                    for attr, pk in zip(attributes, pks)
-                ),
+    # The three pairing product equations are combined into one by raising the second
+    # and third to random exponents r2 and r3.
+    r2 = rand_BN_order()
+    r3 = rand_BN_order()
+    return pair_product(
+        # the second equation contributes e(g1^r2, y2), which is merged into the first
+        (generator_G1(r2) / aggr_sigma.z1, aggr_sigma.y2),
+        # transpose the public keys once and aggregate them per message component
+        *zip(message.m, map(product_G2, zip(*(pk.x.x for pk in pks)))),
+        ((aggr_sigma.y1**r2).invert(), _G2),
+        (generator_G1(r3), aggr_sigma.v2),
+        (
+            (aggr_sigma.y1**r3).invert(),
+            product_G2(
+                [_H(attr.value.encode("utf8"), pk) for attr, pk in zip(attributes, pks)]
             ),
-        ).is_neutral()
-    )
+        ),
+    ).is_neutral()
 
 
 def change_representation(
@@ -173,34 +196,37 @@ def change_representation(
     return tbeq.change_representation(message, sigma, mu)
 
 
-def aggregate(_: MainPublicKey, signatures: List[Signature]) -> Optional[Signature]:
-    """Aggregate a list of signatures."""
+def aggregate_unchecked(_: MainPublicKey, signatures: List[Signature]) -> Signature:
+    """Aggregate a list of signatures that are known to share y1 and y2."""
 
     base_sig = signatures[0]
-    for sig in signatures[1:]:
-        if sig.y1 != base_sig.y1 or sig.y2 != base_sig.y2:
-            return None
-
     return Signature(
-        product_G1(signature.z1 for signature in signatures),
+        product_G1([signature.z1 for signature in signatures]),
         base_sig.y1,
         base_sig.y2,
-        product_G2(signature.v2 for signature in signatures),
+        product_G2([signature.v2 for signature in signatures]),
     )
 
 
+def aggregate(mpk: MainPublicKey, signatures: List[Signature]) -> Optional[Signature]:
+    """Aggregate a list of signatures."""
+
+    base_sig = signatures[0]
+    y1, y2 = base_sig.y1, base_sig.y2
+    if any(sig.y1 != y1 or sig.y2 != y2 for sig in signatures[1:]):
+        return None
+
+    return aggregate_unchecked(mpk, signatures)
+
+
 def _findpk(mpk: MainPublicKey, attribute: str) -> PublicKey:
-    for pk in mpk.x:
-        if attribute == pk.attrName:
-            return pk
-    assert False
+    """Raises KeyError for unknown attributes."""
+    return mpk.by_name[attribute]
 
 
 def _findsk(msk: MainPrivateKey, attribute: str) -> PrivateKey:
-    for sk in msk.x:
-        if attribute == sk.attrName:
-            return sk
-    assert False
+    """Raises KeyError for unknown attributes."""
+    return msk.by_name[attribute]
 
 
 def _pks_for_attr(
@@ -212,12 +238,13 @@ def _pks_for_attr(
 def aidgen(attributes: Iterable[Attribute], nonce: bytes) -> bytes:
     """Generate AID from a list of attributes and a nonce."""
 
-    sth = hashlib.shake_256()
-    for attr in attributes:
-        sth.update(attr.name.encode("utf-8"))
-        sth.update(attr.value.encode("utf-8"))
-    sth.update(nonce)
-    return sth.digest(64)
+    # hash all inputs at once instead of updating the context piece by piece
+    data = b"".join(
+        part
+        for attr in attributes
+        for part in (attr.name.encode("utf-8"), attr.value.encode("utf-8"))
+    )
+    return hashlib.shake_256(data + nonce).digest(64)
 
 
 def test_aaeq(l: int) -> None:
@@ -132,11 +132,10 @@ def helper_show(
     aid = aaeq.aidgen(attributes, nonce)
     sigma = splitsign.sign3(apsig.presigma, apsig.ps)
 
-    # aggregate AAEQ signatures
-    aggrsigma = aaeq.aggregate(
+    # aggregate AAEQ signatures; all of them were issued together and share y1 and y2
+    aggrsigma = aaeq.aggregate_unchecked(
         ipk, [credentials.signatures[attribute.name] for attribute in attributes]
     )
-    assert aggrsigma is not None
 
     # rerandomize
     r = rand_BN_order()
@@ -19,6 +19,7 @@
 # SOFTWARE.
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
 
 from pyrelic import (
@@ -35,6 +36,10 @@ from pyrelic import (
     power_product_G2,
 )
 
+_G1 = generator_G1()
+_G2 = generator_G2()
+_ORDER = order()
+
 
 @dataclass
 class Parameters:
@@ -55,7 +60,7 @@ class PublicKey:
     def is_canonical(self) -> bool:
         """Checks if the public key is canonical."""
 
-        return self.a == generator_G1()
+        return self.a == _G1
 
 
 @dataclass
@@ -133,6 +138,7 @@ def sign1() -> Tuple[SecretState, PublicState]:
     return SecretState(k), PublicState(generator_G1(k), generator_G2(k))
 
 
+@lru_cache(maxsize=1024)
 def _H(message: bytes) -> G1:
     return hash_to_G1(message)
 
@@ -141,9 +147,9 @@ def sign2(sk: PrivateKey, message: bytes, st: SecretState) -> PreSignature:
     """Perform second step of the split signing procedure."""
 
     r = rand_BN_order()
-    kinv = st.k.mod_inv(order())
+    kinv = st.k.mod_inv(_ORDER)
     g1 = sk.y * _H(message) ** r
-    return PreSignature(g1, (r * kinv) % order())
+    return PreSignature(g1, (r * kinv) % _ORDER)
 
 
 def sign3(psigma: PreSignature, pst: PublicState) -> Signature:
@@ -155,15 +161,15 @@ def sign3(psigma: PreSignature, pst: PublicState) -> Signature:
 def verify(pk: PublicKey, message: bytes, sigma: Signature) -> bool:
     """Verify a SFPK signature."""
 
-    first = pair_product(
-        (sigma.sig2.invert(), generator_G2()), (generator_G1(), sigma.sig3)
-    )
-    second = pair_product(
-        (sigma.sig1.invert(), generator_G2()),
+    # Both pairing product equations are combined into one by raising the first to a
+    # random exponent r. Pairings with the same G2 element are merged, which leaves a
+    # single inversion and three pairings.
+    r = rand_BN_order()
+    return pair_product(
+        ((sigma.sig1 * sigma.sig2**r).invert(), _G2),
+        (generator_G1(r) * _H(message), sigma.sig3),
         (pk.b, pk.params.y2),
-        (_H(message), sigma.sig3),
-    )
-    return first.is_neutral() and second.is_neutral()
+    ).is_neutral()
 
 
 def chgpk(pk: PublicKey, r: BN) -> PublicKey:
@@ -179,7 +185,7 @@ def chgsk(sk: PrivateKey, r: BN) -> PrivateKey:
 
 
 def _chkrep(delta: _Trapdoor, pk: PublicKey) -> bool:
-    return pair_product((pk.a, delta.g2), (pk.b.invert(), generator_G2())).is_neutral()
+    return pair_product((pk.a, delta.g2), (pk.b.invert(), _G2)).is_neutral()
 
 
 def rerand(
@@ -192,8 +198,8 @@ def rerand(
     pknew = chgpk(pk, r)
     sigmanew = Signature(
         power_product_G1((sigma.sig1, _H(message)), (r, k)),
-        power_product_G1((sigma.sig2, generator_G1()), (r, k)),
-        power_product_G2((sigma.sig3, generator_G2()), (r, k)),
+        power_product_G1((sigma.sig2, _G1), (r, k)),
+        power_product_G2((sigma.sig3, _G2), (r, k)),
     )
 
     return pknew, sigmanew
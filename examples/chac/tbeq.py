@@ -20,13 +20,13 @@
 
 import hashlib
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, Tuple, Any, Optional
 
 from pyrelic import (
     BN,
     G1,
     G2,
-    BN_from_int,
     generator_G1,
     generator_G2,
     hash_to_G2,
@@ -37,6 +37,9 @@ from pyrelic import (
     rand_G1,
 )
 
+_G2 = generator_G2()
+_ORDER = order()
+
 
 @dataclass
 class PublicKey:
@@ -69,6 +72,11 @@ class MessageVector:
     m: Tuple[G1, ...]
 
 
+@lru_cache(maxsize=1024)
+def _hash_tag(tag: bytes) -> G2:
+    return hash_to_G2(tag)
+
+
 def keygen(l: int) -> Tuple[PrivateKey, PublicKey]:
     """Generate a new keypair to sign message vectors of length l >= 2."""
 
@@ -79,11 +87,9 @@ def keygen(l: int) -> Tuple[PrivateKey, PublicKey]:
 def _deterministic_y(k: bytes, message: Tuple[G1, ...]) -> BN:
     """Derive y for sign deterministically from the message and the given k."""
 
-    sth = hashlib.shake_256()
-    sth.update(k)
-    for i in message:
-        sth.update(bytes(i))
-    return BN_from_int(int.from_bytes(sth.digest(64), "big") % int(order()))
+    digest = hashlib.shake_256(b"".join((k, *map(bytes, message)))).digest(64)
+    # BN reads the digest as big-endian integer, so the reduction stays in relic
+    return BN(digest) % _ORDER
 
 
 def sign(
@@ -91,7 +97,7 @@ def sign(
     message: MessageVector,
     tag: bytes,
     k: Optional[bytes] = None,
-    H: Callable[[bytes], G2] = hash_to_G2,
+    H: Callable[[bytes], G2] = _hash_tag,
 ) -> Signature:
     """Sign a message vector."""
 
@@ -101,30 +107,38 @@ def sign(
     else:
         y = _deterministic_y(k, message.m)
 
-    z1 = power_product_G1(message.m, sk.x) ** y
-    yinv = y.mod_inv(order())
+    z1 = power_product_G1(message.m, tuple(x.mod_mul(y, _ORDER) for x in sk.x))
+    yinv = y.mod_inv(_ORDER)
 
     return Signature(z1, generator_G1(yinv), generator_G2(yinv), H(tag) ** yinv)
 
 
-def verify(pk: PublicKey, message: MessageVector, tag: Any, sigma: Signature) -> bool:
+def verify(
+    pk: PublicKey,
+    message: MessageVector,
+    tag: Any,
+    sigma: Signature,
+    H: Callable[[bytes], G2] = _hash_tag,
+) -> bool:
     """Verify the signature on a message vector."""
 
     if len(message.m) != len(pk.x):
         return False
 
     # Instead of checking whether two pairings e(x1, y1) and e(x2, y2) are equal, we check
-    # if e(x1, y1) / e(x2, y2) equals one instead. This allows us to make use of the faster
-    # pair_product and a more efficient check.
-    first = pair_product((sigma.z1.invert(), sigma.y2), *zip(message.m, pk.x))
-    second = pair_product(
-        (sigma.y1, generator_G2()), (generator_G1().invert(), sigma.y2)
-    )
-    third = pair_product(
-        (generator_G1(), sigma.v2), (sigma.y1.invert(), hash_to_G2(tag))
-    )
-
-    return first.is_neutral() and second.is_neutral() and third.is_neutral()
+    # if e(x1, y1) / e(x2, y2) equals one instead. The three resulting equations are
+    # combined into one by raising the second and third to random exponents r2 and r3.
+    # This allows us to make use of a single pair_product and a more efficient check.
+    r2 = rand_BN_order()
+    r3 = rand_BN_order()
+    return pair_product(
+        # the second equation contributes e(g1^-r2, y2), which is merged into the first
+        ((sigma.z1 * generator_G1(r2)).invert(), sigma.y2),
+        *zip(message.m, pk.x),
+        (sigma.y1**r2, _G2),
+        (generator_G1(r3), sigma.v2),
+        ((sigma.y1**r3).invert(), H(tag)),
+    ).is_neutral()
 
 
 def change_representation(
@@ -132,12 +146,11 @@ def change_representation(
 ) -> Tuple[MessageVector, Signature]:
     """Change representation of a message vector and its signature."""
 
-    group_order = order()
     psi = rand_BN_order()
-    psi_inv = psi.mod_inv(group_order)
+    psi_inv = psi.mod_inv(_ORDER)
 
     return MessageVector(tuple(m**mu for m in message.m)), Signature(
-        sigma.z1 ** ((psi * mu) % group_order),
+        sigma.z1 ** ((psi * mu) % _ORDER),
         sigma.y1**psi_inv,
         sigma.y2**psi_inv,
         sigma.v2**psi_inv,
@@ -165,6 +178,14 @@ def test_tbeq(l: int) -> None:
     assert not verify(pk, new_message, tag, sigma)
     assert not verify(pk, message, tag, new_sigma)
 
+    # sign and verify with a different hash function for the tag
+    def H(tag: bytes) -> G2:
+        return hash_to_G2(b"other domain" + tag)
+
+    sigma = sign(sk, message, tag, H=H)
+    assert verify(pk, message, tag, sigma, H=H)
+    assert not verify(pk, message, tag, sigma)
+
 
 if __name__ == "__main__":
     for l in range(2, 5):
@@ -39,21 +39,26 @@ from pyrelic import (
     generator_G2,
     generator_GT,
     hash_to_G1,
-    neutral_GT,
     pair,
     pair_product,
     power_product_G1,
+    power_product_GT,
+    product_GT,
     rand_BN_order,
 )
-import math
 import itertools
 import enum
 import struct
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Union, Sequence, Any, TypeVar, Callable, cast, Tuple, Dict
 
 T = TypeVar("T")
 
+# generator of G2 and group order used throughout the schemes
+_G2 = generator_G2()
+_ORDER = pyrelic.order()
+
 # Scheme 2
 
 
@@ -110,6 +115,10 @@ class HPRASID:
 class HPRAVMK:
     alpha: BN
     pp: HPRAParams
+    ghat: G2 = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.ghat = generator_G2(self.alpha)
 
 
 @dataclass
@@ -126,8 +135,13 @@ def hpra_sgen(pp: HPRAParams) -> Tuple[HPRASID, HPRASPrivateKey, HPRASPublicKey]
     return HPRASID(g2beta), HPRASPrivateKey(beta, pk), pk
 
 
+@lru_cache(maxsize=1024)
+def _hash_to_G1(data: bytes) -> G1:
+    return hash_to_G1(data)
+
+
 def hpra_hash(*args: Any) -> G1:
-    return hash_to_G1(b"|".join(bytes(arg) for arg in args))
+    return _hash_to_G1(b"|".join(bytes(arg) for arg in args))
 
 
 def hpra_srgen(sk: HPRASPrivateKey, aux: None) -> None:
@@ -148,7 +162,8 @@ def hpra_sign(sk: HPRASPrivateKey, ms: Sequence[BN], tau: Any, id_=None) -> G1:
 def hpra_verify(pk: HPRASPublicKey, ms: Sequence[BN], tau: Any, sigma: G1) -> bool:
     sigmap = hpra_hash(tau, pk.pk1)
     sigmap = power_product_G1(pk.pp.gs, ms, sigmap)
-    return pair(sigmap, pk.pk1) == pair(sigma, generator_G2())
+    # e(sigmap, pk1) == e(sigma, g2) iff e(sigmap, pk1) * e(sigma^-1, g2) == 1
+    return pair_product((sigmap, pk.pk1), (sigma.invert(), _G2)).is_neutral()
 
 
 def hpra_vrgen(pk: HPRASPublicKey, mk: HPRAVMK, rk: None = None) -> HPRAAK:
@@ -178,30 +193,25 @@ def hpra_averify(
     ids: Sequence[HPRASID],
     weights: Sequence[BN],
 ) -> bool:
-    ghat = generator_G2(mk.alpha)
-    muprime = pair_product(
-        (power_product_G1(mk.pp.gs, msg), ghat),
-        *(
-            (
-                hpra_hash(tau, _id) ** weight,
-                ghat,
-            )
-            for _id, weight in zip(ids, weights)
+    if len(msg) != len(mk.pp.gs) or len(ids) != len(weights):
+        return False
+
+    # all pairings share ghat, so the G1 sides are combined into one multi-exponentiation
+    # and a single pairing is sufficient
+    muprime = pair(
+        power_product_G1(
+            [*mk.pp.gs, *(hpra_hash(tau, _id) for _id in ids)], [*msg, *weights]
         ),
+        mk.ghat,
     )
     return muprime == mu
 
 
 def evalf(msgs: Sequence[Sequence[BN]], weights: Sequence[BN]) -> Tuple[BN, ...]:
-    l = len(msgs[0])
-    order = pyrelic.order()
+    # iterate over the columns of the messages instead of indexing every message per slot
     return tuple(
-        sum(
-            (msg[idx] * weight for msg, weight in zip(msgs, weights)),
-            neutral_BN(),
-        )
-        % order
-        for idx in range(l)
+        sum((m * weight for m, weight in zip(column, weights)), neutral_BN()) % _ORDER
+        for column in zip(*msgs)
     )
 
 
@@ -267,7 +277,7 @@ def hpre_keygen(l: int) -> Tuple[HPREPrivateKey, HPREPublicKey]:
 
     sk = HPREPrivateKey(a1, a2)
     pk = HPREPublicKey(
-        tuple(pair(generator_G1(a), generator_G2()) for a in a1),
+        tuple(pair(generator_G1(a), _G2) for a in a1),
         tuple(generator_G2(a) for a in a2),
     )
 
@@ -322,31 +332,19 @@ def hpre_rencrypt(rk: HPREReEncKey, c: HPRECiphertext) -> HPRECiphertext:
 
 
 def hpre_decrypt(sk: HPREPrivateKey, c: HPRECiphertext) -> Tuple[GT, ...]:
-    order = pyrelic.order()
     if c.level == HPRECiphertextLevel.L1:
         return tuple(cs / cast(GT, c.c0) ** a1 for cs, a1 in zip(c.cs, sk.a1))
     elif c.level == HPRECiphertextLevel.L2:
-        return tuple(
-            cs * pair(cast(G1, c.c0) ** a1.mod_neg(order), generator_G2())
-            for cs, a1 in zip(c.cs, sk.a1)
-        )
+        # e(c0^-a1, g2) = e(c0, g2)^-a1, so a single pairing is sufficient for all slots
+        c0 = pair(cast(G1, c.c0), _G2)
+        return tuple(cs / c0**a1 for cs, a1 in zip(c.cs, sk.a1))
     # elif c.level == HPRECiphertextLevel.LR:
     return tuple(
-        c1 / c0 ** a2.mod_inv(order)
+        c1 / c0 ** a2.mod_inv(_ORDER)
         for c0, c1, a2 in zip(cast(Sequence[GT], c.c0), c.cs, sk.a2)
     )
 
 
-#   def hpre_eval(cs, weights):
-#       level = cs[0].level
-#       c1 = cs[0].c1 ** weights[0]
-#       c2 = cs[1].c2 ** weights[0]
-#       for c, w in zip(cs[1:], weights[1:]):
-#           c1 *= c.c1 ** w
-#           c2 *= c.c2 ** w
-#       return HPRECiphertext(level, c1, c2)
-
-
 def test_hpre() -> None:
     l = 3
     sk1, pk1 = hpre_keygen(l)
@@ -393,7 +391,7 @@ def comb_params(l: int, min_exps: int, max_exps: int) -> CombParams:
     exps = tuple(BN_from_int(exp) for exp in range(min_exps, max_exps))
 
     def precompute_mapping(base: G1) -> Dict[GT, BN]:
-        base_gt = pair(base, generator_G2())
+        base_gt = pair(base, _G2)
         return {base_gt**exp: exp for exp in exps}
 
     return CombParams(pp, tuple(precompute_mapping(base) for base in pp.gs))
@@ -439,7 +437,6 @@ def comb_sign(sk: CombSPrivateKey, ms: Sequence[BN], tau: Any) -> CombSignature:
     """Sign and encrypt message (exponents) with respect to given tag tau."""
 
     r = generator_G1(rand_BN_order())
-    g2 = generator_G2()
     sigma = hpra_sign(sk.sk, ms, tau) * r
     # Make sure that messages are mapped into G_T with the correct base elements, e.g., that match
     # the bases used in Scheme 2.
@@ -449,7 +446,7 @@ def comb_sign(sk: CombSPrivateKey, ms: Sequence[BN], tau: Any) -> CombSignature:
         tuple(
             pair(lhs, rhs)
             for lhs, rhs in itertools.chain(
-                ((base**m, g2) for base, m in zip(sk.sk.pk.pp.gs, ms)),
+                ((base**m, _G2) for base, m in zip(sk.sk.pk.pp.gs, ms)),
                 ((r, sk.sk.pk.pk2),),
             )
         ),
@@ -491,28 +488,15 @@ def comb_agg(
 
     def evalcs(cs: Sequence[HPRECiphertext], weights: Sequence[BN]) -> HPRECiphertext:
         # The same as hpre_eval, but with the correct types for level-2-ciphertexts.
-        l = len(cs[0].cs)
         return HPRECiphertext(
             cs[0].level,
             tuple(
-                math.prod(
-                    (
-                        cast(Sequence[GT], c.c0)[idx] ** weight
-                        for c, weight in zip(cs, weights)
-                    ),
-                    start=neutral_GT(),
-                )  # type: ignore
-                for idx in range(l)
+                power_product_GT(c0s, weights)
+                for c0s in zip(*(cast(Sequence[GT], c.c0) for c in cs))
             ),
             tuple(
-                math.prod(
-                    (
-                        cast(Sequence[GT], c.cs)[idx] ** weight
-                        for c, weight in zip(cs, weights)
-                    ),
-                    start=neutral_GT(),
-                )  # type: ignore
-                for idx in range(l)
+                power_product_GT(css, weights)
+                for css in zip(*(cast(Sequence[GT], c.cs) for c in cs))
             ),
         )
 
@@ -543,30 +527,26 @@ def comb_averify(
         ids: Sequence[HPRASID],
         weights: Sequence[BN],
     ) -> bool:
-        ghat = generator_G2()
         muprime = (
-            math.prod(msg, start=neutral_GT())  # type: ignore
-            * pair_product(
-                *(
-                    (
-                        hpra_hash(tau, _id) ** weight,
-                        ghat,
-                    )
-                    for _id, weight in zip(ids, weights)
-                ),
+            product_GT(msg)
+            * pair(
+                power_product_G1([hpra_hash(tau, _id) for _id in ids], weights),
+                _G2,
             )
         ) ** mk.alpha
         return muprime == mu
 
     ms = hpre_decrypt(mk.rsk, cs)
-    msu, r = ms[:-1], ms[-1]
+    msu = ms[:-1]
     return (
         tuple(
             # compute DLOGs from pre-computed lookup tables
             mk.pp.precomputed[idx][msg]
             for idx, msg in enumerate(msu)
         )
-        if hpra_averify(mk.mk, msu, mu / (r**mk.mk.alpha), tau, ids, weights)
+        # instead of dividing mu by r^alpha, r is included in the product that is raised to
+        # alpha, which saves one exponentiation in GT
+        if hpra_averify(mk.mk, ms, mu, tau, ids, weights)
         else False
     )
 
@@ -42,6 +42,9 @@ from pyrelic import (
 )
 from typing import Tuple
 
+_G2 = generator_G2()
+_ORDER = order()
+
 
 @dataclass
 class PublicKey:
@@ -88,8 +91,8 @@ def sign(sk: PrivateKey, message: MessageVector) -> Signature:
     assert len(sk.x) == len(message.m)
 
     y = rand_BN_order()
-    z = power_product_G1(message.m, sk.x) ** y
-    yinv = y.mod_inv(order())
+    z = power_product_G1(message.m, tuple(x.mod_mul(y, _ORDER) for x in sk.x))
+    yinv = y.mod_inv(_ORDER)
 
     return Signature(z, generator_G1(yinv), generator_G2(yinv))
 
@@ -101,14 +104,16 @@ def verify(pk: PublicKey, message: MessageVector, sigma: Signature) -> bool:
         return False
 
     # Instead of checking whether two pairings e(x1, y1) and e(x2, y2) are equal, we check
-    # if e(x1, y2) / e(x2, y2) equals one instead. This allows us to make use of the faster
-    # pair_product and a more efficient check.
-    first = pair_product((sigma.z.invert(), sigma.yhat), *zip(message.m, pk.x))
-    second = pair_product(
-        (sigma.y, generator_G2()), (generator_G1().invert(), sigma.yhat)
-    )
-
-    return first.is_neutral() and second.is_neutral()
+    # if e(x1, y2) / e(x2, y2) equals one instead. Both resulting equations are combined into
+    # one by raising the second one to a random exponent r. This allows us to make use of a
+    # single pair_product and a more efficient check.
+    r = rand_BN_order()
+    return pair_product(
+        # the second equation contributes e(g1^-r, yhat), which is merged into the first
+        ((sigma.z * generator_G1(r)).invert(), sigma.yhat),
+        *zip(message.m, pk.x),
+        (sigma.y**r, _G2),
+    ).is_neutral()
 
 
 def change_representation(
@@ -119,11 +124,10 @@ def change_representation(
     if not verify(pk, message, sigma):
         raise ValueError("Signature does not verify.")
 
-    group_order = order()
     psi = rand_BN_order()
-    psi_inv = psi.mod_inv(group_order)
+    psi_inv = psi.mod_inv(_ORDER)
     return MessageVector(tuple(m**mu for m in message.m)), Signature(
-        sigma.z ** ((psi * mu) % group_order), sigma.y**psi_inv, sigma.yhat**psi_inv
+        sigma.z ** psi.mod_mul(mu, _ORDER), sigma.y**psi_inv, sigma.yhat**psi_inv
     )
 
 
@@ -36,6 +36,7 @@ from ._relic import (
     neutral_G1,
     order,
     power_product_G1,
+    PrecomputedG1,
     product_G1,
     rand_G1,
     # G2
@@ -44,12 +45,14 @@ from ._relic import (
     hash_to_G2,
     neutral_G2,
     power_product_G2,
+    PrecomputedG2,
     product_G2,
     rand_G2,
     # Gt
     GT,
     generator_GT,
     neutral_GT,
+    power_product_GT,
     product_GT,
     rand_GT,
     # pairings
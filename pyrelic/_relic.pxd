@@ -43,6 +43,9 @@ cpdef G1 hash_to_G1(bytes data)
 cpdef G1 power_product_G1(values, scalars, G1 base=*)
 cpdef G1 product_G1(values, G1 base=*)
 
+cdef class PrecomputedG1:
+    cdef relic.g1_t* table
+
 cdef class G2:
     cdef relic.g2_t value
 
@@ -53,6 +56,9 @@ cpdef G2 hash_to_G2(bytes data)
 cpdef G2 power_product_G2(values, scalars, G2 base=*)
 cpdef G2 product_G2(values, G2 base=*)
 
+cdef class PrecomputedG2:
+    cdef relic.g2_t* table
+
 cdef class GT:
     cdef relic.gt_t value
 
@@ -60,3 +66,4 @@ cpdef GT generator_GT(BN exponent=*)
 cpdef GT rand_GT()
 cpdef GT neutral_GT()
 cpdef GT product_GT(values, GT base=*)
+cpdef GT power_product_GT(values, scalars, GT base=*)
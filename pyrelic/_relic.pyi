@@ -36,6 +36,7 @@ class BN:
     def __mod__(self, mod: BN) -> BN: ...
     def mod_inv(self, mod: BN) -> BN: ...
     def mod_neg(self, mod: BN) -> BN: ...
+    def mod_mul(self, other: BN, mod: BN) -> BN: ...
     def __hash__(self) -> int: ...
     def __nonzero__(self) -> bool: ...
     def __bytes__(self) -> bytes: ...
@@ -75,6 +76,10 @@ def power_product_G1(
     values: Sequence[G1], scalars: Sequence[BN], base: Optional[G1] = ...
 ) -> G1: ...
 
+class PrecomputedG1:
+    def __init__(self, base: G1) -> None: ...
+    def __pow__(self, exp: Union[BN, int], mod: None = ...) -> G1: ...
+
 class G2:
     def __init__(self, bytes: Optional[bytes] = ...) -> None: ...
     def __imul__(self, other: G2) -> G2: ...
@@ -99,6 +104,10 @@ def power_product_G2(
     values: Sequence[G2], scalars: Sequence[BN], base: Optional[G2] = ...
 ) -> G2: ...
 
+class PrecomputedG2:
+    def __init__(self, base: G2) -> None: ...
+    def __pow__(self, exp: Union[BN, int], mod: None = ...) -> G2: ...
+
 class GT:
     def __init__(self, bytes: Optional[bytes] = ...) -> None: ...
     def __imul__(self, other: GT) -> GT: ...
@@ -117,5 +126,8 @@ def generator_GT(exponent: Optional[BN] = ...) -> GT: ...
 def neutral_GT() -> GT: ...
 def rand_GT() -> GT: ...
 def product_GT(values: Iterable[GT], base: Optional[GT] = ...) -> GT: ...
+def power_product_GT(
+    values: Sequence[GT], scalars: Sequence[BN], base: Optional[GT] = ...
+) -> GT: ...
 def pair(g1: G1, g2: G2) -> GT: ...
 def pair_product(*args: Tuple[G1, G2]) -> GT: ...
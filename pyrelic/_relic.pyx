@@ -20,6 +20,7 @@
 
 # cython: language_level=3, binding=True, c_api_binop_methods=True
 
+cimport cython
 from . cimport relic
 from cpython.object cimport Py_LT, Py_EQ, Py_GT, Py_LE, Py_NE, Py_GE
 from cpython cimport int as Integer
@@ -271,6 +272,16 @@ cdef class BN:
     def mod_neg(BN self, BN mod):
         return (-self) % mod
 
+    def mod_mul(BN self, BN other, BN mod):
+        cdef BN result
+        if not _check_mul_length(self.value, other.value):
+            raise ValueError("Result of multiplication is too large.")
+
+        result = BN()
+        relic.bn_mul(result.value, self.value, other.value)
+        relic.bn_mod(result.value, result.value, mod.value)
+        return result
+
     # comparisons
 
     def __hash__(self):
@@ -600,6 +611,54 @@ cpdef G1 power_product_G1(values, scalars, G1 base=None):
     return result
 
 
+cdef class PrecomputedG1:
+    """Precomputation table for fast exponentiations of a fixed element in G1."""
+
+    def __cinit__(self):
+        cdef int idx
+        self.table = <relic.g1_t*>malloc(sizeof(relic.g1_t) * relic.RLC_G1_TABLE)
+        if self.table is NULL:
+            raise MemoryError()
+
+        for idx in range(relic.RLC_G1_TABLE):
+            relic.g1_null(self.table[idx])
+        for idx in range(relic.RLC_G1_TABLE):
+            relic.g1_new(self.table[idx])
+
+    def __init__(self, G1 base):
+        """Build the precomputation table for the given base element."""
+
+        with nogil:
+            relic.g1_mul_pre(self.table, base.value)
+
+    def __dealloc__(self):
+        cdef int idx
+        if self.table is not NULL:
+            for idx in reversed(range(relic.RLC_G1_TABLE)):
+                relic.g1_free(self.table[idx])
+            free(self.table)
+
+    def __pow__(PrecomputedG1 self, exp, modulo):
+        cdef G1 result = G1()
+        cdef BN tmp
+        if isinstance(exp, BN):
+            tmp = <BN>exp
+        elif isinstance(exp, int):
+            tmp = BN_from_int(exp)
+        else:
+            return NotImplemented
+
+        if relic.bn_sign(tmp.value) == relic.RLC_NEG:
+            tmp = -tmp
+            with nogil:
+                relic.g1_mul_fix(result.value, self.table, tmp.value)
+            relic.g1_neg(result.value, result.value)
+        else:
+            with nogil:
+                relic.g1_mul_fix(result.value, self.table, tmp.value)
+        return result
+
+
 cdef class G2:
     """Represents an element in the (multiplicative) group G2."""
 
@@ -790,6 +849,54 @@ cpdef G2 power_product_G2(values, scalars, G2 base=None):
     return result
 
 
+cdef class PrecomputedG2:
+    """Precomputation table for fast exponentiations of a fixed element in G2."""
+
+    def __cinit__(self):
+        cdef int idx
+        self.table = <relic.g2_t*>malloc(sizeof(relic.g2_t) * relic.RLC_G2_TABLE)
+        if self.table is NULL:
+            raise MemoryError()
+
+        for idx in range(relic.RLC_G2_TABLE):
+            relic.g2_null(self.table[idx])
+        for idx in range(relic.RLC_G2_TABLE):
+            relic.g2_new(self.table[idx])
+
+    def __init__(self, G2 base):
+        """Build the precomputation table for the given base element."""
+
+        with nogil:
+            relic.g2_mul_pre(self.table, base.value)
+
+    def __dealloc__(self):
+        cdef int idx
+        if self.table is not NULL:
+            for idx in reversed(range(relic.RLC_G2_TABLE)):
+                relic.g2_free(self.table[idx])
+            free(self.table)
+
+    def __pow__(PrecomputedG2 self, exp, modulo):
+        cdef G2 result = G2()
+        cdef BN tmp
+        if isinstance(exp, BN):
+            tmp = <BN>exp
+        elif isinstance(exp, int):
+            tmp = BN_from_int(exp)
+        else:
+            return NotImplemented
+
+        if relic.bn_sign(tmp.value) == relic.RLC_NEG:
+            tmp = -tmp
+            with nogil:
+                relic.g2_mul_fix(result.value, self.table, tmp.value)
+            relic.g2_neg(result.value, result.value)
+        else:
+            with nogil:
+                relic.g2_mul_fix(result.value, self.table, tmp.value)
+        return result
+
+
 cdef class GT:
     """Represents an element in the (multiplicative) group GT."""
 
@@ -914,6 +1021,34 @@ cpdef GT product_GT(values, GT base=None):
     return result
 
 
+cpdef GT power_product_GT(values, scalars, GT base=None):
+    """Computes the product of all elements raised to the respective scalars."""
+
+    cdef size_t length = len(values), idx
+    cdef GT value, tmp = GT(), result = GT()
+    cdef BN scalar
+
+    if length != <size_t>len(scalars):
+        raise ValueError("Length of values and scalars does not match")
+
+    if base is not None:
+        relic.gt_copy(result.value, base.value)
+    else:
+        relic.gt_set_unity(result.value)
+
+    for idx in range(length):
+        if not isinstance(values[idx], GT) or not isinstance(scalars[idx], BN):
+            raise TypeError(f"Expected GT, BN at index {idx} of values and scalars.")
+
+        value = <GT>values[idx]
+        scalar = <BN>scalars[idx]
+
+        with nogil:
+            relic.gt_exp(tmp.value, value.value, scalar.value)
+            relic.gt_mul(result.value, result.value, tmp.value)
+    return result
+
+
 cpdef GT pair(G1 g1, G2 g2):
     """Computes the pairing of g1 and g2."""
 
@@ -923,6 +1058,8 @@ cpdef GT pair(G1 g1, G2 g2):
     return result
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
 def pair_product(*args):
     """Given a list of pairs of G1 and G2 elements, computes the product of their pairings."""
 
@@ -22,7 +22,7 @@ import warnings
 from typing import Union, Optional, Tuple, Any, Sequence, Iterable
 from . import _relic
 from ._relic import BN, neutral_BN, rand_BN_mod, rand_BN_order, BN_from_int
-from ._relic import GT, neutral_GT, rand_GT, generator_GT, product_GT
+from ._relic import GT, neutral_GT, rand_GT, generator_GT, product_GT, power_product_GT
 
 """
 Helper classes with additive notations for G1 and G2
@@ -43,31 +43,31 @@ class G1:
             self.element = _relic.G1(base)
 
     def __add__(self, other: "G1") -> "G1":
-        return G1(self.element * other.element)
+        return _wrap_G1(self.element * other.element)
 
     def __iadd__(self, other: "G1") -> "G1":
         self.element *= other.element
         return self
 
     def __sub__(self, other: "G1") -> "G1":
-        return G1(self.element / other.element)
+        return _wrap_G1(self.element / other.element)
 
     def __isub__(self, other: "G1") -> "G1":
         self.element = self.element / other.element
         return self
 
     def __neg__(self) -> "G1":
-        return G1(self.element.invert())
+        return _wrap_G1(self.element.invert())
 
     def __mul__(self, rhs: Union[int, BN]) -> "G1":
-        return G1(self.element**rhs)
+        return _wrap_G1(self.element**rhs)
 
     def __imul__(self, rhs: Union[int, BN]) -> "G1":
         self.element = self.element**rhs
         return self
 
     def __rmul__(self, lhs: Union[int, BN]) -> "G1":
-        return G1(self.element**lhs)
+        return _wrap_G1(self.element**lhs)
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, G1):
@@ -98,30 +98,37 @@ class G1:
         self.element.set_neutral()
 
 
+def _wrap_G1(element: _relic.G1) -> G1:
+    """Wraps an element without going through the type checks of G1.__init__."""
+    result = G1.__new__(G1)
+    result.element = element
+    return result
+
+
 def neutral_G1() -> G1:
     """Returns the neutral element of G1."""
-    return G1(_relic.neutral_G1())
+    return _wrap_G1(_relic.neutral_G1())
 
 
 def generator_G1(factor: Optional[BN] = None) -> G1:
     """Returns the generator of G1 and if the optional factor is given, the generator multiplied by
     this factor is returned."""
-    return G1(_relic.generator_G1(factor))
+    return _wrap_G1(_relic.generator_G1(factor))
 
 
 def rand_G1() -> G1:
     """Returns a randomly sampled element from G1."""
-    return G1(_relic.rand_G1())
+    return _wrap_G1(_relic.rand_G1())
 
 
 def hash_to_G1(data: bytes) -> G1:
     """Hashes a byte string to an element in G1."""
-    return G1(_relic.hash_to_G1(data))
+    return _wrap_G1(_relic.hash_to_G1(data))
 
 
 def sum_G1(values: Iterable[G1], base: Optional[G1] = None) -> G1:
     """Computes the sum of all elements."""
-    return G1(
+    return _wrap_G1(
         _relic.product_G1(
             (value.element for value in values),
             base.element if base is not None else None,
@@ -133,9 +140,9 @@ def product_sum_G1(
     values: Sequence[G1], scalars: Sequence[BN], base: Optional[G1] = None
 ) -> G1:
     """Computes the sum of all elements multiplied by the respective scalars."""
-    return G1(
+    return _wrap_G1(
         _relic.power_product_G1(
-            tuple(g1.element for g1 in values),
+            [value.element for value in values],
             scalars,
             base.element if base is not None else None,
         )
@@ -159,31 +166,31 @@ class G2:
             self.element = _relic.G2(base)
 
     def __add__(self, other: "G2") -> "G2":
-        return G2(self.element * other.element)
+        return _wrap_G2(self.element * other.element)
 
     def __iadd__(self, other: "G2") -> "G2":
         self.element *= other.element
         return self
 
     def __sub__(self, other: "G2") -> "G2":
-        return G2(self.element / other.element)
+        return _wrap_G2(self.element / other.element)
 
     def __isub__(self, other: "G2") -> "G2":
         self.element = self.element / other.element
         return self
 
     def __neg__(self) -> "G2":
-        return G2(self.element.invert())
+        return _wrap_G2(self.element.invert())
 
     def __mul__(self, rhs: Union[int, BN]) -> "G2":
-        return G2(self.element**rhs)
+        return _wrap_G2(self.element**rhs)
 
     def __imul__(self, rhs: Union[int, BN]) -> "G2":
         self.element = self.element**rhs
         return self
 
     def __rmul__(self, lhs: Union[int, BN]) -> "G2":
-        return G2(self.element**lhs)
+        return _wrap_G2(self.element**lhs)
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, G2):
@@ -214,30 +221,37 @@ class G2:
         self.element.set_neutral()
 
 
+def _wrap_G2(element: _relic.G2) -> G2:
+    """Wraps an element without going through the type checks of G2.__init__."""
+    result = G2.__new__(G2)
+    result.element = element
+    return result
+
+
 def neutral_G2() -> G2:
     """Returns the neutral element of G2."""
-    return G2(_relic.neutral_G2())
+    return _wrap_G2(_relic.neutral_G2())
 
 
 def generator_G2(factor: Optional[BN] = None) -> G2:
     """Returns the generator of G2 and if the optional factor is given, the generator multiplied by
     this factor is returned."""
-    return G2(_relic.generator_G2(factor))
+    return _wrap_G2(_relic.generator_G2(factor))
 
 
 def rand_G2() -> G2:
     """Returns a randomly sampled element from G2."""
-    return G2(_relic.rand_G2())
+    return _wrap_G2(_relic.rand_G2())
 
 
 def hash_to_G2(data: bytes) -> G2:
     """Hashes a byte string to an element in G2."""
-    return G2(_relic.hash_to_G2(data))
+    return _wrap_G2(_relic.hash_to_G2(data))
 
 
 def sum_G2(values: Iterable[G2], base: Optional[G2] = None) -> G2:
     """Computes the sum of all elements."""
-    return G2(
+    return _wrap_G2(
         _relic.product_G2(
             (value.element for value in values),
             base.element if base is not None else None,
@@ -249,9 +263,9 @@ def product_sum_G2(
     values: Sequence[G2], scalars: Sequence[BN], base: Optional[G2] = None
 ) -> G2:
     """Computes the sum of all elements multiplied by the respective scalars."""
-    return G2(
+    return _wrap_G2(
         _relic.power_product_G2(
-            tuple(g1.element for g1 in values),
+            [value.element for value in values],
             scalars,
             base.element if base is not None else None,
         )
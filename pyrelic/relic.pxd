@@ -87,6 +87,7 @@ cdef extern from "<relic/relic_bn.h>" nogil:
     # bn comparison
     int bn_cmp(const bn_t, const bn_t)
     int bn_is_zero(const bn_t)
+    int bn_sign(const bn_t)
 
     # bn randomization
     void bn_rand(bn_t, int, int)
@@ -150,6 +151,14 @@ cdef extern from "<relic/relic_pc.h>" nogil:
     void gt_exp(gt_t, const gt_t, const bn_t)
     void gt_inv(gt_t, const gt_t)
 
+    # gx fixed-base precomputation
+    int RLC_G1_TABLE
+    int RLC_G2_TABLE
+    void g1_mul_pre(g1_t*, const g1_t)
+    void g2_mul_pre(g2_t*, const g2_t)
+    void g1_mul_fix(g1_t, const g1_t*, const bn_t)
+    void g2_mul_fix(g2_t, const g2_t*, const bn_t)
+
     # gx comparison
     int g1_is_infty(const g1_t)
     int g2_is_infty(const g2_t)
@@ -79,16 +79,18 @@ class GroupTests:
         element = self.rand()
         exp = additive.rand_BN_order()
 
-        self.assertEqual(element * int(exp), element * exp)
-        self.assertEqual(element * int(exp), exp * element)
+        multiplied = element * int(exp)
+        self.assertEqual(multiplied, element * exp)
+        self.assertEqual(multiplied, exp * element)
 
     def test_exp_negative(self):
         element = self.rand()
         exp = additive.rand_BN_order()
 
-        self.assertEqual(element * -int(exp), element * -exp)
-        self.assertEqual(element * -exp, self.neutral() - element * exp)
-        self.assertEqual(element * -exp, (self.neutral() - element) * exp)
+        negated = element * -exp
+        self.assertEqual(element * -int(exp), negated)
+        self.assertEqual(negated, self.neutral() - element * exp)
+        self.assertEqual(negated, (self.neutral() - element) * exp)
 
     def test_exp_0(self):
         element = self.rand()
@@ -146,10 +148,10 @@ class TestPair(unittest.TestCase):
         x = additive.rand_BN_order()
         g1 = additive.rand_G1()
         g2 = additive.rand_G2()
-        gt_base = additive.pair(g1, g2)
+        gt_base_x = additive.pair(g1, g2) ** x
 
-        self.assertEqual(additive.pair(g1 * x, g2), gt_base**x)
-        self.assertEqual(additive.pair(g1, g2 * x), gt_base**x)
+        self.assertEqual(additive.pair(g1 * x, g2), gt_base_x)
+        self.assertEqual(additive.pair(g1, g2 * x), gt_base_x)
 
 
 class TestPairingProduct(unittest.TestCase):
@@ -59,25 +59,34 @@ class TestBN(unittest.TestCase):
         lhs = pyrelic.rand_BN_order()
         rhs = pyrelic.rand_BN_order()
 
-        self.assertEqual(lhs + rhs, pyrelic.BN_from_int(int(lhs) + int(rhs)))
-        self.assertEqual(lhs + rhs, lhs + int(rhs))
-        self.assertEqual(lhs + rhs, int(lhs) + rhs)
+        lhs_int, rhs_int = int(lhs), int(rhs)
+        result = lhs + rhs
+
+        self.assertEqual(result, pyrelic.BN_from_int(lhs_int + rhs_int))
+        self.assertEqual(result, lhs + rhs_int)
+        self.assertEqual(result, lhs_int + rhs)
 
     def test_sub(self):
         lhs = pyrelic.rand_BN_order()
         rhs = pyrelic.rand_BN_order()
 
-        self.assertEqual(lhs - rhs, pyrelic.BN_from_int(int(lhs) - int(rhs)))
-        self.assertEqual(lhs - rhs, lhs - int(rhs))
-        self.assertEqual(lhs - rhs, int(lhs) - rhs)
+        lhs_int, rhs_int = int(lhs), int(rhs)
+        result = lhs - rhs
+
+        self.assertEqual(result, pyrelic.BN_from_int(lhs_int - rhs_int))
+        self.assertEqual(result, lhs - rhs_int)
+        self.assertEqual(result, lhs_int - rhs)
 
     def test_mul(self):
         lhs = pyrelic.rand_BN_order()
         rhs = pyrelic.rand_BN_order()
 
-        self.assertEqual(lhs * rhs, pyrelic.BN_from_int(int(lhs) * int(rhs)))
-        self.assertEqual(lhs * rhs, lhs * int(rhs))
-        self.assertEqual(lhs * rhs, int(lhs) * rhs)
+        lhs_int, rhs_int = int(lhs), int(rhs)
+        result = lhs * rhs
+
+        self.assertEqual(result, pyrelic.BN_from_int(lhs_int * rhs_int))
+        self.assertEqual(result, lhs * rhs_int)
+        self.assertEqual(result, lhs_int * rhs)
 
     def test_mod(self):
         lhs = pyrelic.rand_BN_order()
@@ -100,6 +109,31 @@ class TestBN(unittest.TestCase):
 
         self.assertEqual((lhs * rhs) % pyrelic.order(), pyrelic.BN_from_int(1))
 
+    def test_mod_mul(self):
+        lhs = pyrelic.rand_BN_order()
+        rhs = pyrelic.rand_BN_order()
+        order = pyrelic.order()
+
+        self.assertEqual(lhs.mod_mul(rhs, order), (lhs * rhs) % order)
+
+    def test_mod_mul_too_large(self):
+        order = pyrelic.order()
+        lhs = order
+        for _ in range(8):
+            try:
+                product = lhs * lhs
+            except ValueError:
+                # relic was built with a fixed precision, mod_mul has to fail the same way
+                with self.assertRaises(ValueError):
+                    lhs.mod_mul(lhs, order)
+                break
+            self.assertEqual(lhs.mod_mul(lhs, order), product % order)
+            lhs = product
+
+        # no pending relic error may leak into deserialization
+        element = pyrelic.rand_G1()
+        self.assertEqual(pyrelic.G1(bytes(element)), element)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -85,9 +85,10 @@ class GroupTests:
         element = self.rand()
         exp = pyrelic.rand_BN_order()
 
-        self.assertEqual(element ** -int(exp), element**-exp)
-        self.assertEqual(element**-exp, self.neutral() / element**exp)
-        self.assertEqual(element**-exp, (self.neutral() / element) ** exp)
+        negated = element**-exp
+        self.assertEqual(element ** -int(exp), negated)
+        self.assertEqual(negated, self.neutral() / element**exp)
+        self.assertEqual(negated, (self.neutral() / element) ** exp)
 
     def test_exp_0(self):
         element = self.rand()
@@ -101,7 +102,21 @@ class GroupTests:
         self.assertEqual(element**1, element)
 
 
-class TestG1(GroupTests, unittest.TestCase):
+class PrecomputedTests:
+    def test_precomputed(self):
+        element = self.rand()
+        table = self.precomputed(element)
+        exp = pyrelic.rand_BN_order()
+
+        self.assertEqual(table**exp, element**exp)
+        self.assertEqual(table ** int(exp), element**exp)
+        self.assertEqual(table**-exp, element**-exp)
+        unreduced = int(exp) + int(pyrelic.order())
+        self.assertEqual(table**unreduced, element**unreduced)
+        self.assertEqual(table**0, self.neutral())
+
+
+class TestG1(GroupTests, PrecomputedTests, unittest.TestCase):
     def group(self, *args):
         return G1(*args)
 
@@ -114,8 +129,11 @@ class TestG1(GroupTests, unittest.TestCase):
     def rand(self):
         return pyrelic.rand_G1()
 
+    def precomputed(self, *args):
+        return pyrelic.PrecomputedG1(*args)
+
 
-class TestG2(GroupTests, unittest.TestCase):
+class TestG2(GroupTests, PrecomputedTests, unittest.TestCase):
     def group(self, *args):
         return G2(*args)
 
@@ -128,6 +146,9 @@ class TestG2(GroupTests, unittest.TestCase):
     def rand(self):
         return pyrelic.rand_G2()
 
+    def precomputed(self, *args):
+        return pyrelic.PrecomputedG2(*args)
+
 
 class TestGT(GroupTests, unittest.TestCase):
     def group(self, *args):
@@ -142,6 +163,18 @@ class TestGT(GroupTests, unittest.TestCase):
     def rand(self):
         return pyrelic.rand_GT()
 
+    def test_power_product(self):
+        values = [self.rand() for _ in range(3)]
+        scalars = [pyrelic.rand_BN_order() for _ in range(3)]
+
+        self.assertEqual(
+            pyrelic.power_product_GT(values, scalars),
+            (values[0] ** scalars[0])
+            * (values[1] ** scalars[1])
+            * (values[2] ** scalars[2]),
+        )
+        self.assertEqual(pyrelic.power_product_GT([], []), self.neutral())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -57,6 +57,37 @@ class TestDHKEG2(DHKE, unittest.TestCase):
 
 
 class TestSchemes:
+    @unittest.skipUnless(has_examples, "BFE example is not available")
+    def test_bfe(self):
+        from examples import bfe
+
+        sk, pk = bfe.keygen(32, 2**8, 0.01, max_workers=2)
+
+        # identities that are not aligned to the bytes of the bit map
+        for identity in (3, 13, sk.bloom_filter.bitset_size - 3):
+            assert identity in sk
+            del sk[identity]
+            assert identity not in sk
+            assert identity - 1 in sk
+            assert identity + 1 in sk
+            # removing a key twice is a no-op
+            del sk[identity]
+            assert identity not in sk
+            assert identity - 1 in sk
+            assert identity + 1 in sk
+
+        for _ in range(4):
+            k, ctxt = bfe.encaps(pk)
+            received_k = bfe.decaps(sk, ctxt)
+            assert received_k is not None
+            assert k == received_k
+
+            bfe.puncture(sk, ctxt)
+            assert bfe.decaps(sk, ctxt) is None
+            # puncturing on the same positions again keeps the keys removed
+            bfe.puncture(sk, ctxt)
+            assert bfe.decaps(sk, ctxt) is None
+
     @unittest.skipUnless(has_examples, "BF-IBE example is not available")
     def test_bfibe(self):
         from examples import bfibe
@@ -74,6 +105,8 @@ class TestSchemes:
         from examples import hpra
 
         hpra.test_hpra()
+        hpra.test_hpre()
+        hpra.test_comb()
 
     @unittest.skipUnless(has_examples, "SPSEQ example is not available")
     def test_spseq(self):